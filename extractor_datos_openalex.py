@@ -9,13 +9,28 @@ sobre el estado de la ciencia abierta en Ecuador.
 """
 
 import requests
-import json
-import pandas as pd
-import matplotlib.pyplot as plt
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+import orjson
+import msgspec
 import os
-from datetime import datetime
+import argparse
+import functools
+import heapq
+import html
+from operator import attrgetter
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Optional
 import numpy as np
 
+try:
+    import requests_cache
+except ImportError:  # la caché en disco es opcional
+    requests_cache = None
+
 # Configuración de colores corporativos de CEDIA
 CEDIA_COLORS = {
     'dark_blue': '#1D3A54',
@@ -35,14 +50,199 @@ VIZ_DIR = os.path.join(BASE_DIR, 'visualizaciones')
 os.makedirs(DATA_DIR, exist_ok=True)
 os.makedirs(VIZ_DIR, exist_ok=True)
 
-# Configuración de estilo para visualizaciones
-plt.style.use('seaborn-v0_8-whitegrid')
-plt.rcParams['font.family'] = 'sans-serif'
-plt.rcParams['font.sans-serif'] = ['Arial', 'Helvetica', 'DejaVu Sans']
-plt.rcParams['axes.labelcolor'] = CEDIA_COLORS['dark_blue']
-plt.rcParams['axes.titlecolor'] = CEDIA_COLORS['dark_blue']
-plt.rcParams['xtick.color'] = CEDIA_COLORS['dark_blue']
-plt.rcParams['ytick.color'] = CEDIA_COLORS['dark_blue']
+# Archivos de datos generados
+PATH_METADATOS = os.path.join(DATA_DIR, 'metadatos_generales.json')
+PATH_TIPOS_OA = os.path.join(DATA_DIR, 'datos_tipos_oa.json')
+PATH_AREAS = os.path.join(DATA_DIR, 'datos_por_areas.json')
+PATH_AUTORES = os.path.join(DATA_DIR, 'autores_destacados.json')
+PATH_INSTITUCIONES = os.path.join(DATA_DIR, 'instituciones_destacadas.json')
+PATH_COLAB = os.path.join(DATA_DIR, 'colaboracion_internacional.json')
+PATH_RESUMEN = os.path.join(DATA_DIR, 'analisis_resumido.json')
+
+# Archivos de visualizaciones generados
+PATH_TIPOS_OA_PNG = os.path.join(VIZ_DIR, 'distribucion_tipos_oa.png')
+PATH_AREAS_PNG = os.path.join(VIZ_DIR, 'areas_conocimiento_principales.png')
+PATH_AREAS_OA_PNG = os.path.join(VIZ_DIR, 'areas_mayor_acceso_abierto.png')
+PATH_DISTRIBUCION_AREAS_PNG = os.path.join(VIZ_DIR, 'distribucion_areas_conocimiento.png')
+PATH_AUTORES_PRODUCTIVOS_PNG = os.path.join(VIZ_DIR, 'autores_mas_productivos.png')
+PATH_AUTORES_CITADOS_PNG = os.path.join(VIZ_DIR, 'autores_mas_citados.png')
+PATH_PRODUCTIVIDAD_PNG = os.path.join(VIZ_DIR, 'productividad_vs_impacto.png')
+PATH_INSTITUCIONES_PNG = os.path.join(VIZ_DIR, 'instituciones_mas_productivas.png')
+PATH_COLAB_SVG = os.path.join(VIZ_DIR, 'colaboracion_internacional.svg')
+
+# Configuración de la conexión con la API de OpenAlex
+REQUEST_TIMEOUT = 30  # segundos
+MAX_CONCURRENT_REQUESTS = 10  # límite de consultas simultáneas a la API
+CACHE_PATH = os.path.join(DATA_DIR, 'openalex_cache.sqlite')
+CACHE_EXPIRATION = timedelta(hours=24)
+RETRY_POLICY = Retry(
+    total=5,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    raise_on_status=False
+)
+
+# Número de autores más citados incluidos en el análisis resumido
+TOP_N_CITADOS = 20
+
+# Prefijo de los identificadores de país en OpenAlex
+COUNTRY_URL_PREFIX = 'https://openalex.org/countries/'
+COUNTRY_URL_PREFIX_LEN = len(COUNTRY_URL_PREFIX)
+
+# Tipos de acceso abierto reportados por OpenAlex (campo oa_status)
+OA_STATUSES = ['gold', 'diamond', 'green', 'hybrid', 'bronze', 'closed']
+
+# matplotlib se importa bajo demanda, solo cuando se crean visualizaciones
+_plt = None
+
+
+def _get_plt():
+    """
+    Importa matplotlib y aplica la configuración de estilo la primera vez que se usa
+    
+    Returns:
+        module: Módulo matplotlib.pyplot configurado
+    """
+    global _plt
+    if _plt is None:
+        import matplotlib
+        matplotlib.use('Agg')  # backend sin interfaz gráfica: solo se guardan imágenes
+        import matplotlib.pyplot as plt
+        
+        # Configuración de estilo para visualizaciones
+        plt.style.use('seaborn-v0_8-whitegrid')
+        plt.rcParams['font.family'] = 'sans-serif'
+        plt.rcParams['font.sans-serif'] = ['Arial', 'Helvetica', 'DejaVu Sans']
+        plt.rcParams['axes.labelcolor'] = CEDIA_COLORS['dark_blue']
+        plt.rcParams['axes.titlecolor'] = CEDIA_COLORS['dark_blue']
+        plt.rcParams['xtick.color'] = CEDIA_COLORS['dark_blue']
+        plt.rcParams['ytick.color'] = CEDIA_COLORS['dark_blue']
+        
+        _plt = plt
+    return _plt
+
+
+def _render_bar_svg(labels, values, out_path, title='', xlabel='', color=CEDIA_COLORS['turquoise']):
+    """
+    Genera un gráfico de barras horizontales en SVG sin usar matplotlib
+    
+    Args:
+        labels (list): Etiqueta de cada barra, de arriba hacia abajo
+        values (list): Valor de cada barra
+        out_path (str): Ruta del archivo SVG
+        title (str): Título del gráfico
+        xlabel (str): Descripción de los valores
+        color (str): Color de las barras
+    """
+    labels = [str(label) for label in labels]
+    
+    # Dimensiones del gráfico (en píxeles)
+    width = 800
+    bar_height = 24
+    bar_gap = 8
+    margin_top = 50
+    margin_bottom = 50
+    margin_left = 20 + 8 * max((len(label) for label in labels), default=0)
+    margin_right = 70
+    plot_width = width - margin_left - margin_right
+    height = margin_top + len(values) * (bar_height + bar_gap) + margin_bottom
+    max_value = max(values, default=0) or 1
+    text_color = CEDIA_COLORS['dark_blue']
+    
+    elements = [
+        f'<rect width="{width}" height="{height}" fill="white"/>',
+        f'<text x="{width / 2:.1f}" y="30" text-anchor="middle" font-size="16" '
+        f'fill="{text_color}">{html.escape(title)}</text>'
+    ]
+    
+    # Una barra por valor, con su etiqueta a la izquierda y el valor a la derecha
+    for i, (label, value) in enumerate(zip(labels, values)):
+        y = margin_top + i * (bar_height + bar_gap)
+        text_y = y + bar_height / 2
+        bar_width = value / max_value * plot_width
+        elements.append(
+            f'<text x="{margin_left - 8}" y="{text_y:.1f}" text-anchor="end" dominant-baseline="middle" '
+            f'fill="{text_color}">{html.escape(label)}</text>'
+        )
+        elements.append(
+            f'<rect x="{margin_left}" y="{y}" width="{bar_width:.1f}" height="{bar_height}" fill="{color}"/>'
+        )
+        elements.append(
+            f'<text x="{margin_left + bar_width + 5:.1f}" y="{text_y:.1f}" dominant-baseline="middle" '
+            f'fill="{text_color}">{value:.0f}</text>'
+        )
+    
+    elements.append(
+        f'<text x="{margin_left + plot_width / 2:.1f}" y="{height - 20}" text-anchor="middle" '
+        f'fill="{text_color}">{html.escape(xlabel)}</text>'
+    )
+    
+    svg = (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'viewBox="0 0 {width} {height}" font-family="Arial, Helvetica, sans-serif" font-size="12">\n'
+        + '\n'.join(elements)
+        + '\n</svg>\n'
+    )
+    
+    with open(out_path, 'w', encoding='utf-8') as f:
+        f.write(svg)
+
+
+def _dump_json(path, data):
+    """
+    Guarda datos en un archivo JSON de forma atómica
+    
+    Los datos se escriben primero en un archivo temporal que luego reemplaza al
+    destino, de modo que nunca se lee un archivo JSON a medio escribir.
+    
+    Args:
+        path (str): Ruta del archivo JSON
+        data: Datos a guardar
+    """
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    os.replace(tmp_path, path)
+
+
+@functools.lru_cache(maxsize=16)
+def _load_json_cached(path, mtime, schema):
+    """
+    Carga y valida un archivo JSON, reutilizando el resultado mientras el archivo no cambie
+    
+    Args:
+        path (str): Ruta del archivo JSON
+        mtime (float): Fecha de modificación del archivo; forma parte de la clave
+            de caché para que el archivo se vuelva a leer si se reescribe
+        schema: Tipo esperado del contenido (p. ej. list[Author])
+            
+    Returns:
+        Contenido del archivo decodificado en el tipo indicado
+    """
+    with open(path, 'rb') as f:
+        return msgspec.json.decode(f.read(), type=schema)
+
+
+class Author(msgspec.Struct):
+    """Autor destacado, tal como se guarda en autores_destacados.json"""
+    nombre: Optional[str] = None
+    institucion: Optional[str] = None
+    publicaciones_total: int = 0
+    citas: int = 0
+
+
+class Institution(msgspec.Struct):
+    """Institución destacada, tal como se guarda en instituciones_destacadas.json"""
+    nombre: Optional[str] = None
+    publicaciones: int = 0
+    citas: int = 0
+
+
+class CountryCollab(msgspec.Struct):
+    """Publicaciones en colaboración con un país (colaboracion_internacional.json)"""
+    count: int
+    percentage: float
+
 
 class OpenAlexExtractor:
     """Clase para extraer y analizar datos de OpenAlex"""
@@ -57,40 +257,91 @@ class OpenAlexExtractor:
         self.email = email
         self.base_url = 'https://api.openalex.org'
         
+        # Sesión persistente: reutiliza las conexiones TCP/TLS entre consultas y,
+        # si requests-cache está instalado, guarda las respuestas en disco
+        if requests_cache is not None:
+            self.session = requests_cache.CachedSession(
+                CACHE_PATH,
+                expire_after=CACHE_EXPIRATION,
+                allowable_methods=['GET'],
+                cache_control=True
+            )
+        else:
+            self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': f'OpenAccessEC (mailto:{email})',
+            'Accept': 'application/json',
+            # Solicitar respuestas comprimidas solo con las codificaciones que
+            # urllib3 puede descomprimir (gzip, deflate y br si brotli está instalado)
+            'Accept-Encoding': make_headers(accept_encoding=True)['accept-encoding']
+        })
+        self.session.params = {'mailto': email}
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=RETRY_POLICY
+        ))
+        
+        # Limita las consultas simultáneas cuando se ejecutan en paralelo
+        self.request_slots = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+        
+        # Respuestas ya recibidas junto con su ETag, por endpoint y parámetros
+        self.etag_cache = {}
+        
         # Calcular período de análisis (últimos 5 años)
         self.current_year = datetime.now().year
         self.five_years_ago = self.current_year - 5
         self.period = f"{self.five_years_ago}-{self.current_year}"
         
+        # Filtro base de las consultas: publicaciones ecuatorianas del período
+        self.period_filter = f'authorships.institutions.country_code:EC,publication_year:{self.period}'
+        
         # Metadatos generales
         self.total_publications = 0
         
-    def query_api(self, endpoint, params=None):
+    def query_api(self, endpoint, params=None, refresh=False):
         """
         Consulta la API de OpenAlex
         
         Args:
             endpoint (str): Endpoint de la API (works, authors, etc.)
             params (dict): Parámetros de consulta
+            refresh (bool): Si es True, ignora la respuesta guardada en caché
             
         Returns:
             dict: Respuesta JSON de la API
         """
         url = f"{self.base_url}/{endpoint}"
         
-        if params is None:
-            params = {}
+        # Forzar una nueva consulta aunque exista una respuesta en caché
+        options = {'force_refresh': True} if refresh and requests_cache is not None else {}
         
-        # Añadir email para identificación
-        params['mailto'] = self.email
+        # Consulta condicional: si la respuesta no cambió, la API devuelve 304 sin cuerpo
+        cache_key = (endpoint, frozenset((params or {}).items()))
+        cached = None if refresh else self.etag_cache.get(cache_key)
+        headers = {'If-None-Match': cached[0]} if cached else None
         
-        response = requests.get(url, params=params)
-        if response.status_code == 200:
-            return response.json()
-        else:
+        # El email para identificación se envía con los parámetros de la sesión
+        with self.request_slots:
+            response = self.session.get(url, params=params, headers=headers, timeout=REQUEST_TIMEOUT, **options)
+        
+        if response.status_code == 304 and cached:
+            return cached[1]
+        
+        try:
+            response.raise_for_status()
+        except requests.HTTPError:
             print(f"Error en la consulta: {response.status_code}")
             print(response.text)
             return None
+        
+        data = orjson.loads(response.content)
+        
+        etag = response.headers.get('ETag')
+        if etag:
+            self.etag_cache[cache_key] = (etag, data)
+        
+        return data
     
     def get_general_stats(self):
         """
@@ -103,7 +354,7 @@ class OpenAlexExtractor:
         
         # Consultar total de publicaciones
         params = {
-            'filter': f'authorships.institutions.country_code:EC,publication_year:{self.period}',
+            'filter': self.period_filter,
             'per_page': 1
         }
         
@@ -118,18 +369,20 @@ class OpenAlexExtractor:
                 'fecha_consulta': datetime.now().strftime('%Y-%m-%d')
             }
             
-            with open(os.path.join(DATA_DIR, 'metadatos_generales.json'), 'w') as f:
-                json.dump(metadata, f, indent=2)
+            _dump_json(PATH_METADATOS, metadata)
             
             print(f"Total de publicaciones encontradas: {self.total_publications}")
             return metadata
         
         return None
     
-    def get_oa_stats(self):
+    def get_oa_stats(self, visualize=True):
         """
         Obtiene estadísticas de acceso abierto
         
+        Args:
+            visualize (bool): Si es True, crea las visualizaciones correspondientes
+        
         Returns:
             dict: Estadísticas de acceso abierto
         """
@@ -137,7 +390,7 @@ class OpenAlexExtractor:
         
         # Consultar publicaciones de acceso abierto
         params_oa = {
-            'filter': f'authorships.institutions.country_code:EC,publication_year:{self.period},is_oa:true',
+            'filter': f'{self.period_filter},is_oa:true',
             'per_page': 1
         }
         
@@ -150,7 +403,7 @@ class OpenAlexExtractor:
             
             # Consultar distribución por tipo de acceso abierto
             params_oa_types = {
-                'filter': f'authorships.institutions.country_code:EC,publication_year:{self.period}',
+                'filter': self.period_filter,
                 'group_by': 'oa_status'
             }
             
@@ -171,11 +424,11 @@ class OpenAlexExtractor:
                     print(f"  - {oa_type}: {count} ({percentage:.2f}%)")
                 
                 # Guardar datos de tipos de OA
-                with open(os.path.join(DATA_DIR, 'datos_tipos_oa.json'), 'w') as f:
-                    json.dump(oa_types_data, f, indent=2)
+                _dump_json(PATH_TIPOS_OA, oa_types_data)
                 
                 # Crear visualización de tipos de OA
-                self.visualize_oa_types(oa_types_data)
+                if visualize:
+                    self.visualize_oa_types(oa_types_data)
                 
                 return {
                     'total_oa': total_oa,
@@ -185,10 +438,13 @@ class OpenAlexExtractor:
         
         return None
     
-    def get_data_by_field(self):
+    def get_data_by_field(self, visualize=True):
         """
         Obtiene datos por áreas de conocimiento
         
+        Args:
+            visualize (bool): Si es True, crea las visualizaciones correspondientes
+        
         Returns:
             dict: Datos por áreas de conocimiento
         """
@@ -211,80 +467,105 @@ class OpenAlexExtractor:
             {'id': 'https://openalex.org/C121332964', 'nombre': 'Sociology'}
         ]
         
-        # Consultar datos para cada área
+        # Una consulta por tipo de OA agrupada por concepto cubre todas las áreas
+        with ThreadPoolExecutor(max_workers=len(OA_STATUSES)) as executor:
+            counts_by_status = dict(zip(OA_STATUSES, executor.map(self.get_concept_counts, OA_STATUSES)))
+        
+        failed = [oa_status for oa_status, counts in counts_by_status.items() if counts is None]
+        if failed:
+            print(f"No se pudieron obtener los datos por área para: {', '.join(failed)}")
+            return {}
+        
+        # Matriz de publicaciones: una fila por área y una columna por tipo de OA
+        concept_ids = [area['id'].rsplit('/', 1)[-1] for area in areas_conocimiento]
+        matrix = np.array([
+            [counts_by_status[oa_status].get(concept_id, 0) for oa_status in OA_STATUSES]
+            for concept_id in concept_ids
+        ], dtype=np.int64)
+        is_open = np.array([oa_status != 'closed' for oa_status in OA_STATUSES])
+        
+        counts = matrix.sum(axis=1)
+        counts_oa = matrix[:, is_open].sum(axis=1)
+        has_publications = counts > 0
+        
+        # Calcular todos los porcentajes en una sola operación, evitando dividir por cero
+        percentages = counts / self.total_publications * 100
+        percentages_oa = np.divide(counts_oa, counts, out=np.zeros(len(counts)), where=has_publications) * 100
+        percentages_status = np.divide(
+            matrix, counts[:, np.newaxis],
+            out=np.zeros(matrix.shape), where=has_publications[:, np.newaxis]
+        ) * 100
+        
         fields_data = {}
-        for area in areas_conocimiento:
-            area_id = area['id']
+        for i, area in enumerate(areas_conocimiento):
+            if not has_publications[i]:
+                continue
+            
             area_nombre = area['nombre']
+            count = int(counts[i])
+            count_oa = int(counts_oa[i])
+            percentage = float(percentages[i])
+            percentage_oa = float(percentages_oa[i])
             
-            # Consultar publicaciones para esta área
-            params_area = {
-                'filter': f'authorships.institutions.country_code:EC,publication_year:{self.period},concepts.id:{area_id}',
-                'per_page': 1
+            oa_data = {}
+            for j, oa_type in enumerate(OA_STATUSES):
+                if matrix[i, j]:
+                    oa_data[oa_type] = {
+                        'count': int(matrix[i, j]),
+                        'percentage': float(percentages_status[i, j])
+                    }
+            
+            fields_data[area['id']] = {
+                'nombre': area_nombre,
+                'publicaciones': count,
+                'porcentaje': percentage,
+                'publicaciones_oa': count_oa,
+                'porcentaje_oa': percentage_oa,
+                'oa_status': oa_data
             }
             
-            results_area = self.query_api('works', params_area)
-            if results_area and 'meta' in results_area:
-                count = results_area['meta']['count']
-                percentage = (count / self.total_publications) * 100
-                
-                fields_data[area_id] = {
-                    'nombre': area_nombre,
-                    'publicaciones': count,
-                    'porcentaje': percentage
-                }
-                
-                print(f"  - {area_nombre}: {count} publicaciones ({percentage:.2f}%)")
-                
-                # Consultar datos de acceso abierto para esta área
-                params_area_oa = {
-                    'filter': f'authorships.institutions.country_code:EC,publication_year:{self.period},concepts.id:{area_id},is_oa:true',
-                    'per_page': 1
-                }
-                
-                results_area_oa = self.query_api('works', params_area_oa)
-                if results_area_oa and 'meta' in results_area_oa:
-                    count_oa = results_area_oa['meta']['count']
-                    percentage_oa = (count_oa / count) * 100
-                    
-                    fields_data[area_id]['publicaciones_oa'] = count_oa
-                    fields_data[area_id]['porcentaje_oa'] = percentage_oa
-                    
-                    print(f"    - Acceso abierto: {count_oa} publicaciones ({percentage_oa:.2f}%)")
-                    
-                    # Consultar distribución por tipo de OA
-                    params_area_oa_types = {
-                        'filter': f'authorships.institutions.country_code:EC,publication_year:{self.period},concepts.id:{area_id}',
-                        'group_by': 'oa_status'
-                    }
-                    
-                    results_area_oa_types = self.query_api('works', params_area_oa_types)
-                    if results_area_oa_types and 'group_by' in results_area_oa_types:
-                        oa_data = {}
-                        for item in results_area_oa_types['group_by']:
-                            oa_type = item['key']
-                            oa_count = item['count']
-                            oa_percentage = (oa_count / count) * 100
-                            oa_data[oa_type] = {
-                                'count': oa_count,
-                                'percentage': oa_percentage
-                            }
-                        
-                        fields_data[area_id]['oa_status'] = oa_data
+            print(f"  - {area_nombre}: {count} publicaciones ({percentage:.2f}%)")
+            print(f"    - Acceso abierto: {count_oa} publicaciones ({percentage_oa:.2f}%)")
         
         # Guardar datos por áreas
-        with open(os.path.join(DATA_DIR, 'datos_por_areas.json'), 'w') as f:
-            json.dump(fields_data, f, indent=2)
+        _dump_json(PATH_AREAS, fields_data)
         
         # Crear visualizaciones
-        self.visualize_fields_data(fields_data)
+        if visualize:
+            self.visualize_fields_data(fields_data)
         
         return fields_data
     
-    def get_top_authors(self):
+    def get_concept_counts(self, oa_status):
+        """
+        Obtiene el número de publicaciones de un tipo de OA agrupadas por concepto
+        
+        Args:
+            oa_status (str): Tipo de acceso abierto (gold, green, closed, etc.)
+            
+        Returns:
+            dict: Publicaciones por ID corto de concepto (p. ej. 'C41008148'),
+                o None si la consulta falla
+        """
+        params = {
+            'filter': f'{self.period_filter},oa_status:{oa_status}',
+            'group_by': 'concepts.id',
+            'per_page': 200
+        }
+        
+        results = self.query_api('works', params)
+        if results and 'group_by' in results:
+            return {item['key'].rsplit('/', 1)[-1]: item['count'] for item in results['group_by']}
+        
+        return None
+    
+    def get_top_authors(self, visualize=True):
         """
         Obtiene los autores más destacados de Ecuador
         
+        Args:
+            visualize (bool): Si es True, crea las visualizaciones correspondientes
+        
         Returns:
             list: Lista de autores destacados
         """
@@ -313,20 +594,23 @@ class OpenAlexExtractor:
                 print(f"  - {author_data['nombre']} ({author_data['institucion']}): {author_data['publicaciones_total']} publicaciones, {author_data['citas']} citas")
             
             # Guardar datos de autores destacados
-            with open(os.path.join(DATA_DIR, 'autores_destacados.json'), 'w') as f:
-                json.dump(top_authors, f, indent=2)
+            _dump_json(PATH_AUTORES, top_authors)
             
             # Crear visualizaciones
-            self.visualize_top_authors(top_authors)
+            if visualize:
+                self.visualize_top_authors(top_authors)
             
             return top_authors
         
         return []
     
-    def get_top_institutions(self):
+    def get_top_institutions(self, visualize=True):
         """
         Obtiene las instituciones más destacadas de Ecuador
         
+        Args:
+            visualize (bool): Si es True, crea las visualizaciones correspondientes
+        
         Returns:
             list: Lista de instituciones destacadas
         """
@@ -353,27 +637,30 @@ class OpenAlexExtractor:
                 print(f"  - {inst_data['nombre']}: {inst_data['publicaciones']} publicaciones, {inst_data['citas']} citas")
             
             # Guardar datos de instituciones destacadas
-            with open(os.path.join(DATA_DIR, 'instituciones_destacadas.json'), 'w') as f:
-                json.dump(top_institutions, f, indent=2)
+            _dump_json(PATH_INSTITUCIONES, top_institutions)
             
             # Crear visualizaciones
-            self.visualize_top_institutions(top_institutions)
+            if visualize:
+                self.visualize_top_institutions(top_institutions)
             
             return top_institutions
         
         return []
     
-    def get_international_collaboration(self):
+    def get_international_collaboration(self, visualize=True):
         """
         Analiza la colaboración internacional de Ecuador
         
+        Args:
+            visualize (bool): Si es True, crea las visualizaciones correspondientes
+        
         Returns:
             dict: Datos de colaboración internacional
         """
         print("Analizando colaboración internacional...")
         
         params_collab = {
-            'filter': f'authorships.institutions.country_code:EC,publication_year:{self.period}',
+            'filter': self.period_filter,
             'group_by': 'authorships.countries'
         }
         
@@ -392,26 +679,28 @@ class OpenAlexExtractor:
                     print(f"  - {country}: {count} publicaciones ({percentage:.2f}%)")
             
             # Guardar datos de colaboración internacional
-            with open(os.path.join(DATA_DIR, 'colaboracion_internacional.json'), 'w') as f:
-                json.dump(collab_data, f, indent=2)
+            _dump_json(PATH_COLAB, collab_data)
             
             # Crear visualizaciones
-            self.visualize_international_collaboration(collab_data)
+            if visualize:
+                self.visualize_international_collaboration(collab_data)
             
             return collab_data
         
         return {}
     
-    def visualize_oa_types(self, oa_types_data):
+    @staticmethod
+    def visualize_oa_types(oa_types_data):
         """
         Crea visualización de tipos de acceso abierto
         
         Args:
             oa_types_data (dict): Datos de tipos de acceso abierto
         """
-        # Preparar datos para el gráfico
-        labels = list(oa_types_data.keys())
-        sizes = [data['count'] for data in oa_types_data.values()]
+        import pandas as pd
+        
+        plt = _get_plt()
+        dark_blue = CEDIA_COLORS['dark_blue']
         
         # Definir colores para cada tipo de OA
         colors = {
@@ -423,12 +712,33 @@ class OpenAlexExtractor:
             'closed': CEDIA_COLORS['dark_blue']
         }
         
-        # Asignar colores a cada segmento
-        pie_colors = [colors.get(label, '#CCCCCC') for label in labels]
+        # Definir la descripción de cada tipo de OA para la leyenda
+        legend_labels = {
+            'gold': 'Gold: Publicado en revista de acceso abierto con APC',
+            'hybrid': 'Hybrid: Publicado en revista de suscripción con opción OA',
+            'diamond': 'Diamond: Publicado en revista de acceso abierto sin APC',
+            'green': 'Green: Versión de autor disponible en repositorio',
+            'bronze': 'Bronze: Disponible en web de editor sin licencia clara',
+            'closed': 'Closed: Acceso restringido por suscripción'
+        }
+        
+        # Preparar datos para el gráfico, ordenando los tipos de OA según la leyenda
+        # para que los segmentos mantengan un orden estable entre ejecuciones
+        categories = list(legend_labels) + [key for key in oa_types_data if key not in legend_labels]
+        items = np.array(list(oa_types_data.items()), dtype=object).reshape(-1, 2)
+        sizes = np.fromiter((data['count'] for data in items[:, 1]), dtype=np.int64, count=len(items))
+        codes = pd.Categorical(items[:, 0], categories=categories, ordered=True).codes
+        order = np.argsort(codes, kind='stable')
+        labels = items[order, 0].tolist()
+        sizes = sizes[order]
+        
+        # Asignar colores a cada segmento (gris para tipos sin color definido)
+        palette = np.array([colors.get(category, '#CCCCCC') for category in categories])
+        pie_colors = palette[codes[order]].tolist()
         
         # Crear gráfico de pastel
-        plt.figure(figsize=(10, 8))
-        wedges, texts, autotexts = plt.pie(
+        fig, ax = plt.subplots(figsize=(10, 8))
+        wedges, texts, autotexts = ax.pie(
             sizes, 
             labels=labels, 
             autopct='%1.1f%%', 
@@ -439,7 +749,7 @@ class OpenAlexExtractor:
         
         # Personalizar textos
         for text in texts:
-            text.set_color(CEDIA_COLORS['dark_blue'])
+            text.set_color(dark_blue)
             text.set_fontsize(12)
         
         for autotext in autotexts:
@@ -447,270 +757,256 @@ class OpenAlexExtractor:
             autotext.set_fontsize(10)
             autotext.set_fontweight('bold')
         
-        plt.axis('equal')
-        plt.title('Distribución de publicaciones ecuatorianas por tipo de acceso', 
-                fontsize=16, color=CEDIA_COLORS['dark_blue'], pad=20)
+        ax.axis('equal')
+        ax.set_title('Distribución de publicaciones ecuatorianas por tipo de acceso', 
+                fontsize=16, color=dark_blue, pad=20)
         
         # Añadir leyenda explicativa
-        legend_labels = {
-            'gold': 'Gold: Publicado en revista de acceso abierto con APC',
-            'hybrid': 'Hybrid: Publicado en revista de suscripción con opción OA',
-            'diamond': 'Diamond: Publicado en revista de acceso abierto sin APC',
-            'green': 'Green: Versión de autor disponible en repositorio',
-            'bronze': 'Bronze: Disponible en web de editor sin licencia clara',
-            'closed': 'Closed: Acceso restringido por suscripción'
-        }
-        
-        custom_lines = [plt.Line2D([0], [0], color=colors[key], lw=4) for key in legend_labels.keys() if key in labels]
-        custom_labels = [legend_labels[key] for key in legend_labels.keys() if key in labels]
+        labels_set = set(labels)
+        legend_items = [(colors[key], description) for key, description in legend_labels.items() if key in labels_set]
+        custom_lines = [plt.Line2D([0], [0], color=color, lw=4) for color, _ in legend_items]
+        custom_labels = [description for _, description in legend_items]
         
-        plt.legend(custom_lines, custom_labels, loc='lower center', bbox_to_anchor=(0.5, -0.15), 
+        ax.legend(custom_lines, custom_labels, loc='lower center', bbox_to_anchor=(0.5, -0.15), 
                   ncol=2, fontsize=10, frameon=True)
         
-        plt.tight_layout()
-        plt.savefig(os.path.join(VIZ_DIR, 'distribucion_tipos_oa.png'), dpi=300, bbox_inches='tight')
+        fig.tight_layout()
+        fig.savefig(PATH_TIPOS_OA_PNG, dpi=300, bbox_inches='tight')
+        plt.close(fig)
         print("Gráfico de distribución de tipos de OA guardado.")
     
-    def visualize_fields_data(self, fields_data):
+    @staticmethod
+    def visualize_fields_data(fields_data):
         """
         Crea visualizaciones de datos por áreas de conocimiento
         
         Args:
             fields_data (dict): Datos por áreas de conocimiento
         """
-        # Convertir a DataFrame para facilitar la visualización
-        areas_list = []
-        for field_id, data in fields_data.items():
-            area_info = {
-                'id': field_id,
-                'nombre': data['nombre'],
-                'publicaciones': data['publicaciones'],
-                'porcentaje': data['porcentaje']
-            }
-            
-            # Añadir datos de OA si existen
-            if 'porcentaje_oa' in data:
-                area_info['porcentaje_oa'] = data['porcentaje_oa']
-            
-            # Añadir distribución por tipo de OA si existe
-            if 'oa_status' in data:
-                for oa_type, oa_info in data['oa_status'].items():
-                    area_info[f'oa_{oa_type}'] = oa_info['percentage']
-            
-            areas_list.append(area_info)
+        import pandas as pd
         
-        df_areas = pd.DataFrame(areas_list)
+        plt = _get_plt()
+        dark_blue = CEDIA_COLORS['dark_blue']
         
-        # Ordenar por número de publicaciones
-        df_areas = df_areas.sort_values('publicaciones', ascending=False)
+        # Convertir a DataFrame aplanando la distribución por tipo de OA
+        # (oa_status.gold.percentage -> oa_status_gold_percentage -> oa_gold)
+        df_areas = pd.json_normalize(list(fields_data.values()), sep='_')
+        df_areas = df_areas.rename(
+            columns=lambda c: 'oa_' + c.rsplit('_', 2)[1] if c.startswith('oa_status_') and c.endswith('_percentage') else c
+        )
+        df_areas['nombre'] = df_areas['nombre'].astype('category')
         
         # 1. Gráfico de barras de las principales áreas de conocimiento
-        top_areas = df_areas.head(10)
+        top_areas = df_areas.nlargest(10, 'publicaciones')
         
-        plt.figure(figsize=(12, 8))
-        bars = plt.barh(top_areas['nombre'], top_areas['publicaciones'], color=CEDIA_COLORS['turquoise'])
-        plt.xlabel('Número de publicaciones')
-        plt.ylabel('Área de conocimiento')
-        plt.title('Principales áreas de conocimiento en publicaciones ecuatorianas', fontsize=14, color=CEDIA_COLORS['dark_blue'])
+        fig, ax = plt.subplots(figsize=(12, 8))
+        bars = ax.barh(top_areas['nombre'], top_areas['publicaciones'], color=CEDIA_COLORS['turquoise'])
+        ax.set_xlabel('Número de publicaciones')
+        ax.set_ylabel('Área de conocimiento')
+        ax.set_title('Principales áreas de conocimiento en publicaciones ecuatorianas', fontsize=14, color=dark_blue)
         
         # Añadir etiquetas de datos
-        for bar in bars:
-            width = bar.get_width()
-            plt.text(width + 50, bar.get_y() + bar.get_height()/2, f'{int(width)}', 
-                    ha='left', va='center', color=CEDIA_COLORS['dark_blue'])
+        ax.bar_label(bars, fmt='%.0f', padding=5, color=dark_blue)
         
-        plt.tight_layout()
-        plt.savefig(os.path.join(VIZ_DIR, 'areas_conocimiento_principales.png'), dpi=300, bbox_inches='tight')
+        fig.tight_layout()
+        fig.savefig(PATH_AREAS_PNG, dpi=300, bbox_inches='tight')
+        plt.close(fig)
         print("Gráfico de principales áreas de conocimiento guardado.")
         
         # 2. Gráfico de porcentaje de acceso abierto por área
         if 'porcentaje_oa' in df_areas.columns:
-            top_areas_oa = df_areas.sort_values('porcentaje_oa', ascending=False).head(10)
+            top_areas_oa = df_areas.nlargest(10, 'porcentaje_oa')
             
-            plt.figure(figsize=(12, 8))
-            bars = plt.barh(top_areas_oa['nombre'], top_areas_oa['porcentaje_oa'], color=CEDIA_COLORS['green'])
-            plt.xlabel('Porcentaje de publicaciones en acceso abierto (%)')
-            plt.ylabel('Área de conocimiento')
-            plt.title('Áreas con mayor porcentaje de publicaciones en acceso abierto', fontsize=14, color=CEDIA_COLORS['dark_blue'])
-            plt.xlim(0, 100)
+            fig, ax = plt.subplots(figsize=(12, 8))
+            bars = ax.barh(top_areas_oa['nombre'], top_areas_oa['porcentaje_oa'], color=CEDIA_COLORS['green'])
+            ax.set_xlabel('Porcentaje de publicaciones en acceso abierto (%)')
+            ax.set_ylabel('Área de conocimiento')
+            ax.set_title('Áreas con mayor porcentaje de publicaciones en acceso abierto', fontsize=14, color=dark_blue)
+            ax.set_xlim(0, 100)
             
             # Añadir etiquetas de datos
-            for bar in bars:
-                width = bar.get_width()
-                plt.text(width + 1, bar.get_y() + bar.get_height()/2, f'{width:.1f}%', 
-                        ha='left', va='center', color=CEDIA_COLORS['dark_blue'])
+            ax.bar_label(bars, fmt='%.1f%%', padding=5, color=dark_blue)
             
-            plt.tight_layout()
-            plt.savefig(os.path.join(VIZ_DIR, 'areas_mayor_acceso_abierto.png'), dpi=300, bbox_inches='tight')
+            fig.tight_layout()
+            fig.savefig(PATH_AREAS_OA_PNG, dpi=300, bbox_inches='tight')
+            plt.close(fig)
             print("Gráfico de áreas con mayor acceso abierto guardado.")
         
         # 3. Gráfico de pastel con la distribución general de áreas
-        plt.figure(figsize=(12, 12))
+        fig, ax = plt.subplots(figsize=(12, 12))
         
         # Tomar las 8 principales áreas y agrupar el resto
+        top_areas_pie = df_areas.nlargest(8, 'publicaciones')
+        sizes = top_areas_pie['publicaciones'].to_numpy()
+        names = top_areas_pie['nombre'].to_numpy(dtype=object)
         if len(df_areas) > 8:
-            top_areas_pie = df_areas.head(8)
-            other_areas = pd.DataFrame([{
-                'nombre': 'Otras áreas',
-                'publicaciones': df_areas.iloc[8:]['publicaciones'].sum(),
-                'porcentaje': df_areas.iloc[8:]['porcentaje'].sum()
-            }])
-            pie_data = pd.concat([top_areas_pie, other_areas])
-        else:
-            pie_data = df_areas
+            sizes = np.append(sizes, df_areas['publicaciones'].sum() - sizes.sum())
+            names = np.append(names, 'Otras áreas')
         
         # Crear paleta de colores basada en los colores de CEDIA
         colors = [CEDIA_COLORS['turquoise'], CEDIA_COLORS['dark_blue'], CEDIA_COLORS['medium_blue'], 
                 CEDIA_COLORS['light_blue'], CEDIA_COLORS['green'], CEDIA_COLORS['orange'],
                 '#3159AB', '#B9E1E2', '#F7D3B5']
         
-        plt.pie(pie_data['publicaciones'], labels=pie_data['nombre'], autopct='%1.1f%%', 
-                startangle=90, colors=colors[:len(pie_data)], wedgeprops={'edgecolor': 'w', 'linewidth': 1})
+        ax.pie(sizes, labels=names, autopct='%1.1f%%', 
+                startangle=90, colors=colors[:len(sizes)], wedgeprops={'edgecolor': 'w', 'linewidth': 1})
         
-        plt.axis('equal')
-        plt.title('Distribución de publicaciones ecuatorianas por área de conocimiento', 
-                fontsize=16, color=CEDIA_COLORS['dark_blue'], pad=20)
+        ax.axis('equal')
+        ax.set_title('Distribución de publicaciones ecuatorianas por área de conocimiento', 
+                fontsize=16, color=dark_blue, pad=20)
         
-        plt.tight_layout()
-        plt.savefig(os.path.join(VIZ_DIR, 'distribucion_areas_conocimiento.png'), dpi=300, bbox_inches='tight')
+        fig.tight_layout()
+        fig.savefig(PATH_DISTRIBUCION_AREAS_PNG, dpi=300, bbox_inches='tight')
+        plt.close(fig)
         print("Gráfico de distribución general de áreas guardado.")
     
-    def visualize_top_authors(self, top_authors):
+    @staticmethod
+    def visualize_top_authors(top_authors):
         """
         Crea visualizaciones de autores destacados
         
         Args:
             top_authors (list): Lista de autores destacados
         """
+        import pandas as pd
+        
+        plt = _get_plt()
+        dark_blue = CEDIA_COLORS['dark_blue']
+        
         # Convertir a DataFrame para facilitar la visualización
         df_authors = pd.DataFrame(top_authors)
         
-        # Ordenar por número de publicaciones
-        df_authors = df_authors.sort_values('publicaciones_total', ascending=False).head(15)
+        # Seleccionar los autores con más publicaciones
+        df_authors = df_authors.nlargest(15, 'publicaciones_total')
         
         # Crear gráfico de barras para autores destacados por publicaciones
-        plt.figure(figsize=(12, 8))
-        bars = plt.barh(df_authors['nombre'], df_authors['publicaciones_total'], color=CEDIA_COLORS['turquoise'])
-        plt.xlabel('Número de publicaciones')
-        plt.ylabel('Autor')
-        plt.title('Autores ecuatorianos más productivos', fontsize=14, color=CEDIA_COLORS['dark_blue'])
+        fig, ax = plt.subplots(figsize=(12, 8))
+        bars = ax.barh(df_authors['nombre'], df_authors['publicaciones_total'], color=CEDIA_COLORS['turquoise'])
+        ax.set_xlabel('Número de publicaciones')
+        ax.set_ylabel('Autor')
+        ax.set_title('Autores ecuatorianos más productivos', fontsize=14, color=dark_blue)
         
         # Añadir etiquetas de datos
-        for bar in bars:
-            width = bar.get_width()
-            plt.text(width + 5, bar.get_y() + bar.get_height()/2, f'{int(width)}', 
-                    ha='left', va='center', color=CEDIA_COLORS['dark_blue'])
+        ax.bar_label(bars, fmt='%.0f', padding=5, color=dark_blue)
         
-        plt.tight_layout()
-        plt.savefig(os.path.join(VIZ_DIR, 'autores_mas_productivos.png'), dpi=300, bbox_inches='tight')
+        fig.tight_layout()
+        fig.savefig(PATH_AUTORES_PRODUCTIVOS_PNG, dpi=300, bbox_inches='tight')
+        plt.close(fig)
         print("Gráfico de autores más productivos guardado.")
         
         # Crear gráfico de barras para autores destacados por citas
-        df_authors_citas = df_authors.sort_values('citas', ascending=False).head(15)
+        df_authors_citas = df_authors.nlargest(15, 'citas')
         
-        plt.figure(figsize=(12, 8))
-        bars = plt.barh(df_authors_citas['nombre'], df_authors_citas['citas'], color=CEDIA_COLORS['medium_blue'])
-        plt.xlabel('Número de citas')
-        plt.ylabel('Autor')
-        plt.title('Autores ecuatorianos más citados', fontsize=14, color=CEDIA_COLORS['dark_blue'])
+        fig, ax = plt.subplots(figsize=(12, 8))
+        bars = ax.barh(df_authors_citas['nombre'], df_authors_citas['citas'], color=CEDIA_COLORS['medium_blue'])
+        ax.set_xlabel('Número de citas')
+        ax.set_ylabel('Autor')
+        ax.set_title('Autores ecuatorianos más citados', fontsize=14, color=dark_blue)
         
         # Añadir etiquetas de datos
-        for bar in bars:
-            width = bar.get_width()
-            plt.text(width + 5, bar.get_y() + bar.get_height()/2, f'{int(width)}', 
-                    ha='left', va='center', color=CEDIA_COLORS['dark_blue'])
+        ax.bar_label(bars, fmt='%.0f', padding=5, color=dark_blue)
         
-        plt.tight_layout()
-        plt.savefig(os.path.join(VIZ_DIR, 'autores_mas_citados.png'), dpi=300, bbox_inches='tight')
+        fig.tight_layout()
+        fig.savefig(PATH_AUTORES_CITADOS_PNG, dpi=300, bbox_inches='tight')
+        plt.close(fig)
         print("Gráfico de autores más citados guardado.")
         
         # Crear gráfico de dispersión de publicaciones vs citas
-        plt.figure(figsize=(10, 8))
-        plt.scatter(df_authors['publicaciones_total'], df_authors['citas'], 
+        fig, ax = plt.subplots(figsize=(10, 8))
+        ax.scatter(df_authors['publicaciones_total'], df_authors['citas'], 
                 alpha=0.7, s=100, c=[CEDIA_COLORS['turquoise']])
         
-        # Añadir etiquetas para algunos autores destacados
-        for i, row in df_authors.iterrows():
-            if row['citas'] > df_authors['citas'].median() or row['publicaciones_total'] > df_authors['publicaciones_total'].median():
-                plt.annotate(row['nombre'], 
-                            (row['publicaciones_total'], row['citas']),
-                            xytext=(5, 5), textcoords='offset points',
-                            fontsize=8, color=CEDIA_COLORS['dark_blue'])
-        
-        plt.xlabel('Número de publicaciones')
-        plt.ylabel('Número de citas')
-        plt.title('Relación entre productividad e impacto de autores ecuatorianos', fontsize=14, color=CEDIA_COLORS['dark_blue'])
-        plt.grid(True, linestyle='--', alpha=0.7)
-        plt.tight_layout()
-        plt.savefig(os.path.join(VIZ_DIR, 'productividad_vs_impacto.png'), dpi=300, bbox_inches='tight')
+        # Añadir etiquetas para los autores por encima de la mediana en citas o publicaciones
+        median_citas = df_authors['citas'].median()
+        median_publicaciones = df_authors['publicaciones_total'].median()
+        mask = (df_authors['citas'] > median_citas) | (df_authors['publicaciones_total'] > median_publicaciones)
+        selected = df_authors.loc[mask, ['nombre', 'publicaciones_total', 'citas']]
+        
+        for nombre, publicaciones_total, citas in selected.itertuples(index=False):
+            ax.annotate(nombre, 
+                        (publicaciones_total, citas),
+                        xytext=(5, 5), textcoords='offset points',
+                        fontsize=8, color=dark_blue)
+        
+        ax.set_xlabel('Número de publicaciones')
+        ax.set_ylabel('Número de citas')
+        ax.set_title('Relación entre productividad e impacto de autores ecuatorianos', fontsize=14, color=dark_blue)
+        ax.grid(True, linestyle='--', alpha=0.7)
+        fig.tight_layout()
+        fig.savefig(PATH_PRODUCTIVIDAD_PNG, dpi=300, bbox_inches='tight')
+        plt.close(fig)
         print("Gráfico de productividad vs impacto guardado.")
     
-    def visualize_top_institutions(self, top_institutions):
+    @staticmethod
+    def visualize_top_institutions(top_institutions):
         """
         Crea visualizaciones de instituciones destacadas
         
         Args:
             top_institutions (list): Lista de instituciones destacadas
         """
+        import pandas as pd
+        
+        plt = _get_plt()
+        dark_blue = CEDIA_COLORS['dark_blue']
+        
         # Convertir a DataFrame
         df_institutions = pd.DataFrame(top_institutions)
         
-        # Ordenar por número de publicaciones
-        df_institutions = df_institutions.sort_values('publicaciones', ascending=False).head(10)
+        # Seleccionar las instituciones con más publicaciones
+        df_institutions = df_institutions.nlargest(10, 'publicaciones')
         
         # Crear gráfico de barras para instituciones por publicaciones
-        plt.figure(figsize=(12, 8))
-        bars = plt.barh(df_institutions['nombre'], df_institutions['publicaciones'], color=CEDIA_COLORS['green'])
-        plt.xlabel('Número de publicaciones')
-        plt.ylabel('Institución')
-        plt.title('Instituciones ecuatorianas más productivas', fontsize=14, color=CEDIA_COLORS['dark_blue'])
+        fig, ax = plt.subplots(figsize=(12, 8))
+        bars = ax.barh(df_institutions['nombre'], df_institutions['publicaciones'], color=CEDIA_COLORS['green'])
+        ax.set_xlabel('Número de publicaciones')
+        ax.set_ylabel('Institución')
+        ax.set_title('Instituciones ecuatorianas más productivas', fontsize=14, color=dark_blue)
         
         # Añadir etiquetas de datos
-        for bar in bars:
-            width = bar.get_width()
-            plt.text(width + 50, bar.get_y() + bar.get_height()/2, f'{int(width)}', 
-                    ha='left', va='center', color=CEDIA_COLORS['dark_blue'])
+        ax.bar_label(bars, fmt='%.0f', padding=5, color=dark_blue)
         
-        plt.tight_layout()
-        plt.savefig(os.path.join(VIZ_DIR, 'instituciones_mas_productivas.png'), dpi=300, bbox_inches='tight')
+        fig.tight_layout()
+        fig.savefig(PATH_INSTITUCIONES_PNG, dpi=300, bbox_inches='tight')
+        plt.close(fig)
         print("Gráfico de instituciones más productivas guardado.")
     
-    def visualize_international_collaboration(self, collab_data):
+    @staticmethod
+    def visualize_international_collaboration(collab_data):
         """
         Crea visualizaciones de colaboración internacional
         
         Args:
             collab_data (dict): Datos de colaboración internacional
         """
-        # Convertir a DataFrame
-        collab_list = []
-        for country, data in collab_data.items():
-            collab_list.append({
-                'pais': country.replace('https://openalex.org/countries/', ''),
-                'publicaciones': data['count'],
-                'porcentaje': data['percentage']
-            })
-        
-        df_collab = pd.DataFrame(collab_list)
-        
-        # Ordenar por número de publicaciones
-        df_collab = df_collab.sort_values('publicaciones', ascending=False).head(15)
-        
-        # Crear gráfico de barras para colaboración internacional
-        plt.figure(figsize=(12, 8))
-        bars = plt.barh(df_collab['pais'], df_collab['publicaciones'], color=CEDIA_COLORS['orange'])
-        plt.xlabel('Número de publicaciones en colaboración')
-        plt.ylabel('País')
-        plt.title('Principales países colaboradores con Ecuador', fontsize=14, color=CEDIA_COLORS['dark_blue'])
-        
-        # Añadir etiquetas de datos
-        for bar in bars:
-            width = bar.get_width()
-            plt.text(width + 50, bar.get_y() + bar.get_height()/2, f'{int(width)}', 
-                    ha='left', va='center', color=CEDIA_COLORS['dark_blue'])
-        
-        plt.tight_layout()
-        plt.savefig(os.path.join(VIZ_DIR, 'colaboracion_internacional.png'), dpi=300, bbox_inches='tight')
+        import pandas as pd
+        
+        # Convertir a DataFrame a partir de tuplas (una fila por país)
+        df_collab = pd.DataFrame.from_records(
+            [
+                (
+                    country[COUNTRY_URL_PREFIX_LEN:] if country.startswith(COUNTRY_URL_PREFIX) else country,
+                    data['count'],
+                    data['percentage']
+                )
+                for country, data in collab_data.items()
+            ],
+            columns=['pais', 'publicaciones', 'porcentaje']
+        )
+        df_collab['pais'] = df_collab['pais'].astype('category')
+        
+        # Seleccionar los países con más publicaciones
+        df_collab = df_collab.nlargest(15, 'publicaciones')
+        
+        # Crear gráfico de barras para colaboración internacional directamente en SVG
+        _render_bar_svg(
+            df_collab['pais'].tolist(),
+            df_collab['publicaciones'].tolist(),
+            PATH_COLAB_SVG,
+            title='Principales países colaboradores con Ecuador',
+            xlabel='Número de publicaciones en colaboración',
+            color=CEDIA_COLORS['orange']
+        )
         print("Gráfico de colaboración internacional guardado.")
     
     def create_summary_analysis(self):
@@ -724,98 +1020,140 @@ class OpenAlexExtractor:
         
         # Cargar datos de autores destacados
         try:
-            with open(os.path.join(DATA_DIR, 'autores_destacados.json'), 'r') as f:
-                top_authors = json.load(f)
-            df_authors = pd.DataFrame(top_authors)
-            df_authors_citas = df_authors.sort_values('citas', ascending=False)
-        except:
+            top_authors = _load_json_cached(PATH_AUTORES, os.path.getmtime(PATH_AUTORES), list[Author])
+        except (FileNotFoundError, msgspec.DecodeError) as e:
+            print(f"No se pudo cargar {PATH_AUTORES}: {e}")
             top_authors = []
-            df_authors = pd.DataFrame()
-            df_authors_citas = pd.DataFrame()
         
         # Cargar datos de instituciones destacadas
         try:
-            with open(os.path.join(DATA_DIR, 'instituciones_destacadas.json'), 'r') as f:
-                top_institutions = json.load(f)
-            df_institutions = pd.DataFrame(top_institutions)
-        except:
+            top_institutions = _load_json_cached(PATH_INSTITUCIONES, os.path.getmtime(PATH_INSTITUCIONES), list[Institution])
+        except (FileNotFoundError, msgspec.DecodeError) as e:
+            print(f"No se pudo cargar {PATH_INSTITUCIONES}: {e}")
             top_institutions = []
-            df_institutions = pd.DataFrame()
         
         # Cargar datos de colaboración internacional
         try:
-            with open(os.path.join(DATA_DIR, 'colaboracion_internacional.json'), 'r') as f:
-                collab_data = json.load(f)
-            
-            collab_list = []
-            for country, data in collab_data.items():
-                collab_list.append({
-                    'pais': country.replace('https://openalex.org/countries/', ''),
-                    'publicaciones': data['count'],
-                    'porcentaje': data['percentage']
-                })
-            df_collab = pd.DataFrame(collab_list)
-        except:
+            collab_data = _load_json_cached(PATH_COLAB, os.path.getmtime(PATH_COLAB), dict[str, CountryCollab])
+        except (FileNotFoundError, msgspec.DecodeError) as e:
+            print(f"No se pudo cargar {PATH_COLAB}: {e}")
             collab_data = {}
-            df_collab = pd.DataFrame()
+        
+        # Seleccionar los autores más citados
+        top_authors_citas = heapq.nlargest(TOP_N_CITADOS, top_authors, key=attrgetter('citas'))
         
         # Crear análisis resumido
         analysis_results = {
             'autores_destacados': {
                 'total_analizados': len(top_authors),
-                'mas_productivos': df_authors[['nombre', 'institucion', 'publicaciones_total']].to_dict('records') if not df_authors.empty else [],
-                'mas_citados': df_authors_citas[['nombre', 'institucion', 'citas']].to_dict('records') if not df_authors_citas.empty else []
+                'mas_productivos': [
+                    {'nombre': a.nombre, 'institucion': a.institucion, 'publicaciones_total': a.publicaciones_total}
+                    for a in top_authors
+                ],
+                'mas_citados': [
+                    {'nombre': a.nombre, 'institucion': a.institucion, 'citas': a.citas}
+                    for a in top_authors_citas
+                ]
             },
             'instituciones_destacadas': {
                 'total_analizadas': len(top_institutions),
-                'mas_productivas': df_institutions[['nombre', 'publicaciones', 'citas']].to_dict('records') if not df_institutions.empty else []
+                'mas_productivas': [
+                    {'nombre': i.nombre, 'publicaciones': i.publicaciones, 'citas': i.citas}
+                    for i in top_institutions
+                ]
             },
             'colaboracion_internacional': {
                 'total_paises': len(collab_data),
-                'principales_colaboradores': df_collab[['pais', 'publicaciones', 'porcentaje']].to_dict('records') if not df_collab.empty else []
+                # NOTA: no compilar con numba (@njit). La entrada es un dict de objetos Python, sin
+                # tipo nativo en numba, y tiene unos pocos cientos de países: la compilación
+                # inicial (más de 1 s) nunca se amortiza y la lista por comprensión es más rápida.
+                'principales_colaboradores': [
+                    {
+                        'pais': country[COUNTRY_URL_PREFIX_LEN:] if country.startswith(COUNTRY_URL_PREFIX) else country,
+                        'publicaciones': data.count,
+                        'porcentaje': data.percentage
+                    }
+                    for country, data in collab_data.items()
+                ]
             }
         }
         
         # Guardar análisis resumido
-        with open(os.path.join(DATA_DIR, 'analisis_resumido.json'), 'w') as f:
-            json.dump(analysis_results, f, indent=2)
+        _dump_json(PATH_RESUMEN, analysis_results)
         
         print("Análisis resumido guardado.")
         return analysis_results
     
-    def run_full_analysis(self):
+    def run_full_analysis(self, visualize=True):
         """
         Ejecuta el análisis completo de datos
+        
+        Args:
+            visualize (bool): Si es False, omite la creación de visualizaciones
         """
         print(f"Iniciando análisis completo de publicaciones científicas ecuatorianas ({self.period})...")
         
-        # 1. Obtener estadísticas generales
+        # 1. Obtener estadísticas generales (el resto de etapas depende del total)
         self.get_general_stats()
         
-        # 2. Obtener estadísticas de acceso abierto
-        self.get_oa_stats()
-        
-        # 3. Obtener datos por áreas de conocimiento
-        self.get_data_by_field()
-        
-        # 4. Obtener autores destacados
-        self.get_top_authors()
-        
-        # 5. Obtener instituciones destacadas
-        self.get_top_institutions()
-        
-        # 6. Analizar colaboración internacional
-        self.get_international_collaboration()
+        # 2-6. Las demás consultas son independientes y se ejecutan en paralelo
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            oa_stats = executor.submit(self.get_oa_stats, visualize=False)
+            fields_data = executor.submit(self.get_data_by_field, visualize=False)
+            top_authors = executor.submit(self.get_top_authors, visualize=False)
+            top_institutions = executor.submit(self.get_top_institutions, visualize=False)
+            collab_data = executor.submit(self.get_international_collaboration, visualize=False)
+        
+        oa_stats = oa_stats.result()
+        fields_data = fields_data.result()
+        top_authors = top_authors.result()
+        top_institutions = top_institutions.result()
+        collab_data = collab_data.result()
+        
+        # Crear las visualizaciones: cada gráfico es independiente, así que se
+        # renderizan en paralelo en procesos separados (pyplot no es seguro entre hilos)
+        if visualize:
+            plots = [
+                ('visualize_oa_types', oa_stats['oa_types'] if oa_stats else None),
+                ('visualize_fields_data', fields_data),
+                ('visualize_top_authors', top_authors),
+                ('visualize_top_institutions', top_institutions),
+                ('visualize_international_collaboration', collab_data)
+            ]
+            
+            with ProcessPoolExecutor(max_workers=4) as executor:
+                futures = [executor.submit(_render_plot, name, data) for name, data in plots if data]
+                for future in futures:
+                    future.result()
         
         # 7. Crear análisis resumido
         self.create_summary_analysis()
         
         print("Análisis completo finalizado.")
         print(f"Datos guardados en: {DATA_DIR}")
-        print(f"Visualizaciones guardadas en: {VIZ_DIR}")
+        if visualize:
+            print(f"Visualizaciones guardadas en: {VIZ_DIR}")
+
+
+def _render_plot(name, data):
+    """
+    Crea una visualización; se ejecuta en un proceso del pool de renderizado
+    
+    Args:
+        name (str): Nombre del método visualize_* de OpenAlexExtractor
+        data: Datos que recibe el método de visualización
+    """
+    getattr(OpenAlexExtractor, name)(data)
 
 
 # Ejemplo de uso
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description='Extrae y analiza datos de publicaciones científicas ecuatorianas desde OpenAlex'
+    )
+    parser.add_argument('--no-viz', action='store_true',
+                        help='Solo extrae los datos, sin crear visualizaciones')
+    args = parser.parse_args()
+    
     extractor = OpenAlexExtractor()
-    extractor.run_full_analysis()
+    extractor.run_full_analysis(visualize=not args.no_viz)